@@ -8,9 +8,6 @@ Create Date: 2024-11-25 14:35:00.896507
 
 from typing import Sequence, Union
 
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
 from alembic import op
 from letta.settings import settings
 
@@ -26,10 +23,24 @@ def upgrade() -> None:
     if not settings.letta_pg_uri_no_default:
         return
 
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column("agents", "tools", new_column_name="tool_names")
-    op.drop_column("agents", "memory")
-    # ### end Alembic commands ###
+    # Null out memory in bounded batches before dropping it. DROP COLUMN itself is
+    # metadata-only in Postgres, but the old values linger as dead column data until
+    # rows are rewritten; pre-nulling in 10k chunks rewrites them with bounded
+    # per-statement work so vacuum can reclaim the space, instead of one huge UPDATE
+    # on multi-GB tables.
+    conn = op.get_bind()
+    while True:
+        result = conn.exec_driver_sql(
+            "UPDATE agents SET memory = NULL WHERE ctid IN (SELECT ctid FROM agents WHERE memory IS NOT NULL LIMIT 10000)"
+        )
+        if result.rowcount == 0:
+            break
+
+    # Postgres cannot fold RENAME COLUMN into a multi-action ALTER TABLE, and pg8000
+    # (the driver behind letta_pg_uri) rejects multi-command strings, so issue the two
+    # statements separately; both are metadata-only and near-instant
+    op.execute("ALTER TABLE agents RENAME COLUMN tools TO tool_names")
+    op.execute("ALTER TABLE agents DROP COLUMN memory")
 
 
 def downgrade() -> None:
@@ -37,7 +48,5 @@ def downgrade() -> None:
     if not settings.letta_pg_uri_no_default:
         return
 
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column("agents", "tool_names", new_column_name="tools")
-    op.add_column("agents", sa.Column("memory", postgresql.JSON(astext_type=sa.Text()), autoincrement=False, nullable=True))
-    # ### end Alembic commands ###
+    op.execute("ALTER TABLE agents RENAME COLUMN tool_names TO tools")
+    op.execute("ALTER TABLE agents ADD COLUMN memory JSON")
@@ -0,0 +1,34 @@
+"""add composite index to llm_batch_items
+
+Revision ID: c9f0a1d4b821
+Revises: 5d27a719b24d
+Create Date: 2026-08-30 10:12:41.332871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9f0a1d4b821"
+down_revision: Union[str, None] = "5d27a719b24d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Note some issues at least with pg8000 with concurrent index creation
+    # with op.get_context().autocommit_block():
+    #     op.create_index(
+    #         "ix_llm_batch_items_batch_agent",
+    #         "llm_batch_items",
+    #         ["llm_batch_id", "agent_id"],
+    #         unique=False,
+    #         postgresql_concurrently=True,
+    #     )
+    op.create_index("ix_llm_batch_items_batch_agent", "llm_batch_items", ["llm_batch_id", "agent_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_batch_items_batch_agent", table_name="llm_batch_items")
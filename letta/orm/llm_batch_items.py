@@ -22,6 +22,8 @@ class LLMBatchItem(SqlalchemyBase, OrganizationMixin, AgentMixin):
         Index("ix_llm_batch_items_llm_batch_id", "llm_batch_id"),
         Index("ix_llm_batch_items_agent_id", "agent_id"),
         Index("ix_llm_batch_items_status", "request_status"),
+        # covers the (llm_batch_id, agent_id) lookups used by the bulk update paths
+        Index("ix_llm_batch_items_batch_agent", "llm_batch_id", "agent_id"),
     )
 
     # TODO: We want to migrate all the ORM models to do this, so we will need to move this to the SqlalchemyBase
@@ -0,0 +1,38 @@
+from typing import Any, Dict
+
+from letta.helpers.converters import serialize_tool_calls
+from letta.orm.message import Message
+
+
+def message_to_dict(message: Message) -> Dict[str, Any]:
+    """
+    Serialize a Message ORM row to the same dict SerializedMessageSchema produces
+    when dumped with `id` excluded (the agent-dump path).
+
+    Messages have a closed, known shape, so building the dict directly skips
+    marshmallow's per-field dispatch chain entirely, which dominates dump time for
+    agents with long histories. Keep this in sync with the Message ORM columns and
+    SerializedMessageSchema.Meta.exclude.
+    """
+    created_at = message.created_at
+    updated_at = message.updated_at
+    return {
+        "role": message.role,
+        "text": message.text,
+        "content": message.content,
+        "model": message.model,
+        "name": message.name,
+        "tool_calls": serialize_tool_calls(message.tool_calls),
+        "tool_call_id": message.tool_call_id,
+        "tool_returns": message.tool_returns,
+        "group_id": message.group_id,
+        "sender_id": message.sender_id,
+        "batch_item_id": message.batch_item_id,
+        "is_err": message.is_err,
+        "approval_request_id": message.approval_request_id,
+        "approve": message.approve,
+        "denial_reason": message.denial_reason,
+        "sequence_id": message.sequence_id,
+        "created_at": created_at.isoformat() if created_at is not None else None,
+        "updated_at": updated_at.isoformat() if updated_at is not None else None,
+    }
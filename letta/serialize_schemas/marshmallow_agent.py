@@ -1,4 +1,6 @@
-from typing import Dict, Optional
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, List, Optional
 
 from marshmallow import fields, post_dump, pre_load
 from sqlalchemy import func
@@ -8,11 +10,11 @@ import letta
 from letta.orm import Agent, Message as MessageModel
 from letta.schemas.agent import AgentState as PydanticAgentState
 from letta.schemas.user import User
+from letta.serialize_schemas.fast_message import message_to_dict
 from letta.serialize_schemas.marshmallow_agent_environment_variable import SerializedAgentEnvironmentVariableSchema
 from letta.serialize_schemas.marshmallow_base import BaseSchema
 from letta.serialize_schemas.marshmallow_block import SerializedBlockSchema
 from letta.serialize_schemas.marshmallow_custom_fields import EmbeddingConfigField, LLMConfigField, ToolRulesField
-from letta.serialize_schemas.marshmallow_message import SerializedMessageSchema
 from letta.serialize_schemas.marshmallow_tag import SerializedAgentTagSchema
 from letta.serialize_schemas.marshmallow_tool import SerializedToolSchema
 from letta.settings import DatabaseChoice, settings
@@ -32,6 +34,8 @@ class MarshmallowAgentSchema(BaseSchema):
     FIELD_IN_CONTEXT_INDICES = "in_context_message_indices"
     FIELD_ID = "id"
 
+    CONTEXT_MESSAGES_BY_AGENT = "messages_by_agent"
+
     llm_config = LLMConfigField()
     embedding_config = EmbeddingConfigField()
 
@@ -43,158 +47,187 @@ class MarshmallowAgentSchema(BaseSchema):
     tags = fields.List(fields.Nested(SerializedAgentTagSchema))
 
     def __init__(self, *args, session: sessionmaker, actor: User, max_steps: Optional[int] = None, **kwargs):
-        super().__init__(*args, actor=actor, **kwargs)
-        self.session = session
+        super().__init__(*args, session=session, actor=actor, **kwargs)
         self.max_steps = max_steps
 
-        # Propagate session and actor to nested schemas automatically
-        for field in self.fields.values():
-            if isinstance(field, fields.List) and isinstance(field.inner, fields.Nested):
-                field.inner.schema.session = session
-                field.inner.schema.actor = actor
-            elif isinstance(field, fields.Nested):
-                field.schema.session = session
-                field.schema.actor = actor
+        # Propagate session and actor to nested schemas through the marshmallow
+        # context, which is inherited when the nested schemas are constructed;
+        # this avoids walking (and mutating) every nested field per instantiation
+        self.context.update({"session": session, "actor": actor})
 
-    @post_dump
-    def attach_messages(self, data: Dict, **kwargs):
+    @classmethod
+    def preload_messages(cls, session, agent_ids: List[str], organization_id: str) -> Dict[str, List[MessageModel]]:
         """
-        After dumping the agent, load all its Message rows and serialize them here.
+        Fetch the messages for many agents with a single IN query, grouped by agent id.
+
+        Callers serializing several agents can stash the result in the schema context
+        (`schema.context[cls.CONTEXT_MESSAGES_BY_AGENT] = ...`) so each dump reads from
+        the preloaded dict instead of issuing its own per-agent query. Not compatible
+        with max_steps, which needs the per-agent filtered queries.
         """
-        # TODO: This is hacky, but want to move fast, please refactor moving forward
-        from letta.server.db import db_registry
+        if not agent_ids:
+            return {}
+
+        rows = (
+            session.query(MessageModel)
+            .filter(
+                MessageModel.agent_id.in_(agent_ids),
+                MessageModel.organization_id == organization_id,
+            )
+            .order_by(MessageModel.agent_id.asc(), MessageModel.sequence_id.asc())
+            .all()
+        )
+        return {agent_id: list(group) for agent_id, group in groupby(rows, key=attrgetter("agent_id"))}
 
-        with db_registry.session() as session:
-            agent_id = data.get("id")
+    def _fetch_messages(self, agent_id: str):
+        """
+        Load the agent's Message rows in sequence order, honoring max_steps.
 
-            if self.max_steps is not None:
-                # first, always get the system message
-                system_msg = (
-                    session.query(MessageModel)
+        Reuses the session the agent was dumped with rather than opening a brand-new
+        one per dump; a static eager-loaded relationship does not fit here because
+        the message set depends on max_steps and the actor's organization.
+        """
+        preloaded = self.context.get(self.CONTEXT_MESSAGES_BY_AGENT)
+        if preloaded is not None:
+            return preloaded.get(agent_id, [])
+
+        session = self.session
+        if self.max_steps is not None:
+            # first, always get the system message
+            system_msg = (
+                session.query(MessageModel)
+                .filter(
+                    MessageModel.agent_id == agent_id,
+                    MessageModel.organization_id == self.actor.organization_id,
+                    MessageModel.role == "system",
+                )
+                .order_by(MessageModel.sequence_id.asc())
+                .first()
+            )
+
+            if settings.database_engine is DatabaseChoice.POSTGRES:
+                # efficient PostgreSQL approach using subquery
+                user_msg_subquery = (
+                    session.query(MessageModel.sequence_id)
                     .filter(
                         MessageModel.agent_id == agent_id,
                         MessageModel.organization_id == self.actor.organization_id,
-                        MessageModel.role == "system",
+                        MessageModel.role == "user",
                     )
-                    .order_by(MessageModel.sequence_id.asc())
-                    .first()
+                    .order_by(MessageModel.sequence_id.desc())
+                    .limit(self.max_steps)
+                    .subquery()
                 )
 
-                if settings.database_engine is DatabaseChoice.POSTGRES:
-                    # efficient PostgreSQL approach using subquery
-                    user_msg_subquery = (
-                        session.query(MessageModel.sequence_id)
-                        .filter(
-                            MessageModel.agent_id == agent_id,
-                            MessageModel.organization_id == self.actor.organization_id,
-                            MessageModel.role == "user",
-                        )
-                        .order_by(MessageModel.sequence_id.desc())
-                        .limit(self.max_steps)
-                        .subquery()
-                    )
+                # get the minimum sequence_id from the subquery
+                cutoff_sequence_id = session.query(func.min(user_msg_subquery.c.sequence_id)).scalar()
 
-                    # get the minimum sequence_id from the subquery
-                    cutoff_sequence_id = session.query(func.min(user_msg_subquery.c.sequence_id)).scalar()
-
-                    if cutoff_sequence_id:
-                        # get messages from cutoff, excluding system message to avoid duplicates
-                        step_msgs = (
-                            session.query(MessageModel)
-                            .filter(
-                                MessageModel.agent_id == agent_id,
-                                MessageModel.organization_id == self.actor.organization_id,
-                                MessageModel.sequence_id >= cutoff_sequence_id,
-                                MessageModel.role != "system",
-                            )
-                            .order_by(MessageModel.sequence_id.asc())
-                            .all()
-                        )
-                        # combine system message with step messages
-                        msgs = [system_msg] + step_msgs if system_msg else step_msgs
-                    else:
-                        # no user messages, just return system message
-                        msgs = [system_msg] if system_msg else []
-                else:
-                    # sqlite approach: get all user messages first, then get messages from cutoff
-                    user_messages = (
-                        session.query(MessageModel.sequence_id)
+                if cutoff_sequence_id:
+                    # get messages from cutoff, excluding system message to avoid duplicates
+                    step_msgs = (
+                        session.query(MessageModel)
                         .filter(
                             MessageModel.agent_id == agent_id,
                             MessageModel.organization_id == self.actor.organization_id,
-                            MessageModel.role == "user",
+                            MessageModel.sequence_id >= cutoff_sequence_id,
+                            MessageModel.role != "system",
                         )
-                        .order_by(MessageModel.sequence_id.desc())
-                        .limit(self.max_steps)
+                        .order_by(MessageModel.sequence_id.asc())
                         .all()
                     )
-
-                    if user_messages:
-                        # get the minimum sequence_id
-                        cutoff_sequence_id = min(msg.sequence_id for msg in user_messages)
-
-                        # get messages from cutoff, excluding system message to avoid duplicates
-                        step_msgs = (
-                            session.query(MessageModel)
-                            .filter(
-                                MessageModel.agent_id == agent_id,
-                                MessageModel.organization_id == self.actor.organization_id,
-                                MessageModel.sequence_id >= cutoff_sequence_id,
-                                MessageModel.role != "system",
-                            )
-                            .order_by(MessageModel.sequence_id.asc())
-                            .all()
-                        )
-                        # combine system message with step messages
-                        msgs = [system_msg] + step_msgs if system_msg else step_msgs
-                    else:
-                        # no user messages, just return system message
-                        msgs = [system_msg] if system_msg else []
+                    # combine system message with step messages
+                    msgs = [system_msg] + step_msgs if system_msg else step_msgs
+                else:
+                    # no user messages, just return system message
+                    msgs = [system_msg] if system_msg else []
             else:
-                # if no limit, get all messages in ascending order
-                msgs = (
-                    session.query(MessageModel)
+                # sqlite approach: get all user messages first, then get messages from cutoff
+                user_messages = (
+                    session.query(MessageModel.sequence_id)
                     .filter(
                         MessageModel.agent_id == agent_id,
                         MessageModel.organization_id == self.actor.organization_id,
+                        MessageModel.role == "user",
                     )
-                    .order_by(MessageModel.sequence_id.asc())
+                    .order_by(MessageModel.sequence_id.desc())
+                    .limit(self.max_steps)
                     .all()
                 )
 
-            # overwrite the "messages" key with a fully serialized list
-            data[self.FIELD_MESSAGES] = [SerializedMessageSchema(session=self.session, actor=self.actor).dump(m) for m in msgs]
+                if user_messages:
+                    # get the minimum sequence_id
+                    cutoff_sequence_id = min(msg.sequence_id for msg in user_messages)
 
-        return data
+                    # get messages from cutoff, excluding system message to avoid duplicates
+                    step_msgs = (
+                        session.query(MessageModel)
+                        .filter(
+                            MessageModel.agent_id == agent_id,
+                            MessageModel.organization_id == self.actor.organization_id,
+                            MessageModel.sequence_id >= cutoff_sequence_id,
+                            MessageModel.role != "system",
+                        )
+                        .order_by(MessageModel.sequence_id.asc())
+                        .all()
+                    )
+                    # combine system message with step messages
+                    msgs = [system_msg] + step_msgs if system_msg else step_msgs
+                else:
+                    # no user messages, just return system message
+                    msgs = [system_msg] if system_msg else []
+        else:
+            # if no limit, get all messages in ascending order
+            msgs = (
+                session.query(MessageModel)
+                .filter(
+                    MessageModel.agent_id == agent_id,
+                    MessageModel.organization_id == self.actor.organization_id,
+                )
+                .order_by(MessageModel.sequence_id.asc())
+                .all()
+            )
+
+        return msgs
 
     @post_dump
     def sanitize_ids(self, data: Dict, **kwargs):
         """
-        - Removes `message_ids`
+        Single post-dump pass over the dumped agent:
+        - Loads the agent's Message rows and serializes them into `messages`
+        - Removes `id`/creator fields and `message_ids`
         - Adds versioning
         - Marks messages as in-context, preserving the order of the original `message_ids`
-        - Removes individual message `id` fields
+        - Hides the value of `tool_exec_environment_variables`
+
+        Kept as one hook (and named to shadow BaseSchema.sanitize_ids) so marshmallow
+        re-enters the dumped dict once per agent instead of once per hook.
         """
+        agent_id = data.get("id")
+        msgs = self._fetch_messages(agent_id)
+
+        # index the raw ORM rows up front so the dumped dicts never need to carry
+        # (and later pop) per-message ids
+        id_to_index = {m.id: i for i, m in enumerate(msgs)}
+
+        # overwrite the "messages" key with a fully serialized list; messages have a
+        # fixed shape, so the hand-written dict path avoids marshmallow dispatch per field
+        data[self.FIELD_MESSAGES] = [message_to_dict(m) for m in msgs]
+
         del data["id"]
         del data["_created_by_id"]
         del data["_last_updated_by_id"]
         data[self.FIELD_VERSION] = letta.__version__
 
         original_message_ids = data.pop(self.FIELD_MESSAGE_IDS, [])
-        messages = data.get(self.FIELD_MESSAGES, [])
 
-        # Build a mapping from message id to its first occurrence index and remove the id in one pass
-        id_to_index = {}
-        for idx, message in enumerate(messages):
-            msg_id = message.pop(self.FIELD_ID, None)
-            if msg_id is not None and msg_id not in id_to_index:
-                id_to_index[msg_id] = idx
-
-        # Build in-context indices in the same order as the original message_ids
+        # Build in-context indices in the same order as the original `message_ids`
         in_context_indices = [id_to_index[msg_id] for msg_id in original_message_ids if msg_id in id_to_index]
 
         data[self.FIELD_IN_CONTEXT_INDICES] = in_context_indices
-        data[self.FIELD_MESSAGES] = messages
+
+        # hide the value of tool_exec_environment_variables; need to be re-set at load time
+        for env_var in data.get("tool_exec_environment_variables", []):
+            env_var["value"] = ""
 
         return data
 
@@ -207,15 +240,6 @@ class MarshmallowAgentSchema(BaseSchema):
 
         return data
 
-    @post_dump
-    def hide_tool_exec_environment_variables(self, data: Dict, **kwargs):
-        """Hide the value of tool_exec_environment_variables"""
-
-        for env_var in data.get("tool_exec_environment_variables", []):
-            # need to be re-set at load time
-            env_var["value"] = ""
-        return data
-
     @pre_load
     def check_version(self, data, **kwargs):
         """Check version and remove it from the schema"""
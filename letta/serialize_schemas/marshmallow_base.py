@@ -1,6 +1,7 @@
+from types import CodeType
 from typing import Dict, Optional
 
-from marshmallow import post_dump, pre_load
+from marshmallow import missing, post_dump, pre_load
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
 from letta.schemas.user import User
@@ -16,14 +17,69 @@ class BaseSchema(SQLAlchemyAutoSchema):
 
     def __init__(self, *args, actor: Optional[User] = None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.actor = actor
+        # actor and session may be passed directly, or arrive through the marshmallow
+        # context, which parent schemas propagate to nested schemas automatically
+        self.actor = actor if actor is not None else self.context.get("actor")
+        if self.session is None:
+            self.session = self.context.get("session")
+        # built lazily on first dump, then reused for every subsequent dump
+        self._compiled_dump = None
 
     @classmethod
     def generate_id(cls) -> Optional[str]:
-        if cls.__pydantic_model__:
-            return cls.__pydantic_model__.generate_id()
+        # resolve the pydantic id factory once per schema class; regenerate_ids calls
+        # this for every loaded row, so skip the repeated attribute dispatch
+        factory = cls.__dict__.get("_id_factory")
+        if factory is None:
+            if cls.__pydantic_model__ is None:
+                return None
+            factory = cls.__pydantic_model__.generate_id
+            cls._id_factory = factory
 
-        return None
+        return factory()
+
+    # maps a dump plan (the (attr_name, data_key) tuple of a schema's dump_fields) to
+    # its compiled code object, shared across all schema instances with that shape
+    _dump_code_cache: Dict[tuple, CodeType] = {}
+
+    def _compile_dump(self):
+        """
+        Build a serializer specialized to this schema's dump_fields.
+
+        Unrolls marshmallow's generic per-field _serialize loop into generated code
+        with each field's bound serialize callable and data key baked in as constants
+        (the toasted-marshmallow approach), skipping the per-field dict iteration and
+        data_key resolution on every dump. The generated source depends only on the
+        schema's dump plan, so its code object is memoized class-wide and each
+        instance merely binds its own field callables into a fresh namespace.
+        """
+        plan = tuple(
+            (attr_name, field_obj.data_key if field_obj.data_key is not None else attr_name)
+            for attr_name, field_obj in self.dump_fields.items()
+        )
+        code = BaseSchema._dump_code_cache.get(plan)
+        if code is None:
+            lines = ["def _compiled_dump(obj):", "    ret = _dict_class()"]
+            for index, (attr_name, data_key) in enumerate(plan):
+                lines.append(f"    value = _serialize_{index}({attr_name!r}, obj, accessor=_accessor)")
+                lines.append("    if value is not _missing:")
+                lines.append(f"        ret[{data_key!r}] = value")
+            lines.append("    return ret")
+            code = compile("\n".join(lines), f"<{type(self).__name__} dump>", "exec")
+            BaseSchema._dump_code_cache[plan] = code
+
+        namespace = {"_missing": missing, "_dict_class": self.dict_class, "_accessor": self.get_attribute}
+        for index, field_obj in enumerate(self.dump_fields.values()):
+            namespace[f"_serialize_{index}"] = field_obj.serialize
+        exec(code, namespace)
+        return namespace["_compiled_dump"]
+
+    def _serialize(self, obj, *, many: bool = False):
+        if many and obj is not None:
+            return [self._serialize(item, many=False) for item in obj]
+        if self._compiled_dump is None:
+            self._compiled_dump = self._compile_dump()
+        return self._compiled_dump(obj)
 
     @post_dump
     def sanitize_ids(self, data: Dict, **kwargs) -> Dict:
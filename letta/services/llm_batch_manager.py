@@ -1,12 +1,14 @@
 import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 from anthropic.types.beta.messages import BetaMessageBatch, BetaMessageBatchIndividualResponse
-from sqlalchemy import desc, func, select, tuple_
+from sqlalchemy import Values, bindparam, column, desc, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from letta.jobs.types import BatchPollingResult, ItemUpdateInfo, RequestStatusUpdateInfo, StepStatusUpdateInfo
 from letta.log import get_logger
 from letta.orm import Message as MessageModel
+from letta.orm.errors import NoResultFound
 from letta.orm.llm_batch_items import LLMBatchItem
 from letta.orm.llm_batch_job import LLMBatchJob
 from letta.otel.tracing import trace_method
@@ -16,10 +18,17 @@ from letta.schemas.llm_config import LLMConfig
 from letta.schemas.message import Message as PydanticMessage
 from letta.schemas.user import User as PydanticUser
 from letta.server.db import db_registry
+from letta.settings import DatabaseChoice, settings
 from letta.utils import enforce_types
 
 logger = get_logger(__name__)
 
+# max number of (llm_batch_id, agent_id) pairs per tuple IN clause
+PAIR_QUERY_CHUNK_SIZE = 1000
+
+# rows fetched per round-trip when streaming batch items
+BATCH_ITEM_YIELD_PER = 500
+
 
 class LLMBatchManager:
     """Manager for handling both LLMBatchJob and LLMBatchItem operations."""
@@ -50,11 +59,17 @@ class LLMBatchManager:
 
     @enforce_types
     @trace_method
-    async def get_llm_batch_job_by_id_async(self, llm_batch_id: str, actor: Optional[PydanticUser] = None) -> PydanticLLMBatchJob:
-        """Retrieve a single batch job by ID."""
+    async def get_llm_batch_job_by_id_async(
+        self, llm_batch_id: str, actor: Optional[PydanticUser] = None, to_pydantic: bool = True
+    ) -> Union[PydanticLLMBatchJob, LLMBatchJob]:
+        """Retrieve a single batch job by ID.
+
+        Set to_pydantic=False to skip the Pydantic conversion and get the ORM row
+        back directly, e.g. when only a field or two is needed.
+        """
         async with db_registry.async_session() as session:
             batch = await LLMBatchJob.read_async(db_session=session, identifier=llm_batch_id, actor=actor)
-            return batch.to_pydantic()
+            return batch.to_pydantic() if to_pydantic else batch
 
     @enforce_types
     @trace_method
@@ -64,15 +79,36 @@ class LLMBatchManager:
         status: JobStatus,
         actor: Optional[PydanticUser] = None,
         latest_polling_response: Optional[BetaMessageBatch] = None,
+        now: Optional[datetime.datetime] = None,
     ) -> PydanticLLMBatchJob:
-        """Update a batch job’s status and optionally its polling response."""
+        """Update a batch job’s status and optionally its polling response with one UPDATE ... RETURNING round-trip.
+
+        Callers updating many batches in a loop (e.g. a polling sweep) can compute
+        `now` once and pass it in instead of paying for a clock read per call.
+        """
         async with db_registry.async_session() as session:
-            batch = await LLMBatchJob.read_async(db_session=session, identifier=llm_batch_id, actor=actor)
-            batch.status = status
-            batch.latest_polling_response = latest_polling_response
-            batch.last_polled_at = datetime.datetime.now(datetime.timezone.utc)
-            batch = await batch.update_async(db_session=session, actor=actor)
-            return batch.to_pydantic()
+            if now is None:
+                now = datetime.datetime.now(datetime.timezone.utc)
+            values = {
+                "status": status,
+                "latest_polling_response": latest_polling_response,
+                "last_polled_at": now,
+                "updated_at": now,
+            }
+            stmt = update(LLMBatchJob).where(LLMBatchJob.id == llm_batch_id)
+            if actor is not None:
+                stmt = stmt.where(LLMBatchJob.organization_id == actor.organization_id)
+                values["_last_updated_by_id"] = actor.id
+
+            stmt = stmt.values(**values).returning(LLMBatchJob).execution_options(synchronize_session=False)
+            result = await session.execute(stmt)
+            batch = result.scalar_one_or_none()
+            if batch is None:
+                raise NoResultFound(f"LLMBatchJob not found with id {llm_batch_id}")
+
+            pydantic_batch = batch.to_pydantic()
+            await session.commit()
+            return pydantic_batch
 
     async def bulk_update_llm_batch_statuses_async(
         self,
@@ -206,9 +242,13 @@ class LLMBatchManager:
     @enforce_types
     @trace_method
     async def list_running_llm_batches_async(
-        self, actor: Optional[PydanticUser] = None, weeks: Optional[int] = None, batch_size: Optional[int] = None
-    ) -> List[PydanticLLMBatchJob]:
-        """Return all running LLM batch jobs, optionally filtered by actor's organization and recent weeks."""
+        self, actor: Optional[PydanticUser] = None, weeks: Optional[int] = None, batch_size: Optional[int] = None, to_pydantic: bool = True
+    ) -> Union[List[PydanticLLMBatchJob], List[LLMBatchJob]]:
+        """Return all running LLM batch jobs, optionally filtered by actor's organization and recent weeks.
+
+        Set to_pydantic=False to skip the Pydantic conversion and get the ORM rows
+        back directly, e.g. when only a field or two is needed.
+        """
         async with db_registry.async_session() as session:
             query = select(LLMBatchJob).where(LLMBatchJob.status == JobStatus.running)
 
@@ -223,7 +263,8 @@ class LLMBatchManager:
                 query = query.limit(batch_size)
 
             results = await session.execute(query)
-            return [batch.to_pydantic() for batch in results.scalars().all()]
+            batches = results.scalars().all()
+            return [batch.to_pydantic() for batch in batches] if to_pydantic else list(batches)
 
     @enforce_types
     @trace_method
@@ -267,26 +308,33 @@ class LLMBatchManager:
             List of created batch items as Pydantic models
         """
         async with db_registry.async_session() as session:
-            # Convert Pydantic models to ORM objects
-            orm_items = []
-            for item in llm_batch_items:
-                orm_item = LLMBatchItem(
-                    id=item.id,
-                    llm_batch_id=item.llm_batch_id,
-                    agent_id=item.agent_id,
-                    llm_config=item.llm_config,
-                    request_status=item.request_status,
-                    step_status=item.step_status,
-                    step_state=item.step_state,
-                    organization_id=actor.organization_id,
-                )
-                orm_items.append(orm_item)
-
-            created_items = await LLMBatchItem.batch_create_async(orm_items, session, actor=actor, no_commit=True, no_refresh=True)
-
-            pydantic_items = [item.to_pydantic() for item in created_items]
+            # Insert via Core-level mappings to skip per-object unit-of-work overhead,
+            # mirroring the bulk_update_mappings pattern used for bulk status updates
+            mappings = [
+                {
+                    "id": item.id,
+                    "llm_batch_id": item.llm_batch_id,
+                    "agent_id": item.agent_id,
+                    "llm_config": item.llm_config,
+                    "request_status": item.request_status,
+                    "step_status": item.step_status,
+                    "step_state": item.step_state,
+                    "organization_id": actor.organization_id,
+                    "_created_by_id": actor.id,
+                    "_last_updated_by_id": actor.id,
+                }
+                for item in llm_batch_items
+            ]
+
+            await session.run_sync(lambda ses: ses.bulk_insert_mappings(LLMBatchItem, mappings))
             await session.commit()
-            return pydantic_items
+
+            # Re-query the created rows in one IN query so callers get server-side
+            # defaults, then restore input order (IN returns rows in arbitrary order)
+            item_ids = [mapping["id"] for mapping in mappings]
+            result = await session.execute(select(LLMBatchItem).where(LLMBatchItem.id.in_(item_ids)))
+            items_by_id = {item.id: item for item in result.scalars().all()}
+            return [items_by_id[item_id].to_pydantic() for item_id in item_ids]
 
     @enforce_types
     @trace_method
@@ -307,21 +355,36 @@ class LLMBatchManager:
         llm_request_response: Optional[BetaMessageBatchIndividualResponse] = None,
         step_state: Optional[AgentStepState] = None,
     ) -> PydanticLLMBatchItem:
-        """Update fields on a batch item."""
+        """Update fields on a batch item with a single UPDATE ... RETURNING round-trip."""
         async with db_registry.async_session() as session:
-            item = await LLMBatchItem.read_async(db_session=session, identifier=item_id, actor=actor)
-
-            if request_status:
-                item.request_status = request_status
-            if step_status:
-                item.step_status = step_status
-            if llm_request_response:
-                item.batch_request_result = llm_request_response
-            if step_state:
-                item.step_state = step_state
+            values = {
+                key: value
+                for key, value in {
+                    "request_status": request_status,
+                    "step_status": step_status,
+                    "batch_request_result": llm_request_response,
+                    "step_state": step_state,
+                }.items()
+                if value is not None
+            }
+            values["updated_at"] = datetime.datetime.now(datetime.timezone.utc)
+            values["_last_updated_by_id"] = actor.id
+
+            stmt = (
+                update(LLMBatchItem)
+                .where(LLMBatchItem.id == item_id, LLMBatchItem.organization_id == actor.organization_id)
+                .values(**values)
+                .returning(LLMBatchItem)
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(stmt)
+            item = result.scalar_one_or_none()
+            if item is None:
+                raise NoResultFound(f"LLMBatchItem not found with id {item_id}")
 
-            result = await item.update_async(db_session=session, actor=actor)
-            return result.to_pydantic()
+            pydantic_item = item.to_pydantic()
+            await session.commit()
+            return pydantic_item
 
     @enforce_types
     @trace_method
@@ -334,7 +397,8 @@ class LLMBatchManager:
         agent_id: Optional[str] = None,
         request_status: Optional[JobStatus] = None,
         step_status: Optional[AgentStepStatus] = None,
-    ) -> List[PydanticLLMBatchItem]:
+        to_pydantic: bool = True,
+    ) -> Union[List[PydanticLLMBatchItem], List[LLMBatchItem]]:
         """
         List all batch items for a given llm_batch_id, optionally filtered by additional criteria and limited in count.
 
@@ -345,6 +409,40 @@ class LLMBatchManager:
             - step_status: Filter items based on their step execution status.
 
         The results are ordered by their id in ascending order.
+        Set to_pydantic=False to skip the Pydantic conversion and get the ORM rows back directly.
+        """
+        return [
+            item
+            async for item in self.iter_llm_batch_items_async(
+                llm_batch_id=llm_batch_id,
+                limit=limit,
+                actor=actor,
+                after=after,
+                agent_id=agent_id,
+                request_status=request_status,
+                step_status=step_status,
+                to_pydantic=to_pydantic,
+            )
+        ]
+
+    async def iter_llm_batch_items_async(
+        self,
+        llm_batch_id: str,
+        limit: Optional[int] = None,
+        actor: Optional[PydanticUser] = None,
+        after: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        request_status: Optional[JobStatus] = None,
+        step_status: Optional[AgentStepStatus] = None,
+        to_pydantic: bool = True,
+    ) -> AsyncGenerator[Union[PydanticLLMBatchItem, LLMBatchItem], None]:
+        """
+        Stream batch items for a given llm_batch_id, yielding each as a Pydantic model.
+
+        Takes the same filters as list_llm_batch_items_async, but fetches rows in
+        chunks of BATCH_ITEM_YIELD_PER via a server-side cursor instead of
+        materializing the whole result set, so large batches can be consumed
+        row-by-row with bounded memory.
         """
         async with db_registry.async_session() as session:
             query = select(LLMBatchItem).where(LLMBatchItem.llm_batch_id == llm_batch_id)
@@ -367,12 +465,17 @@ class LLMBatchManager:
             if limit is not None:
                 query = query.limit(limit)
 
-            results = await session.execute(query)
-            return [item.to_pydantic() for item in results.scalars()]
+            results = await session.stream_scalars(query.execution_options(yield_per=BATCH_ITEM_YIELD_PER))
+            async for item in results:
+                yield item.to_pydantic() if to_pydantic else item
 
     @trace_method
     async def bulk_update_llm_batch_items_async(
-        self, llm_batch_id_agent_id_pairs: List[Tuple[str, str]], field_updates: List[Dict[str, Any]], strict: bool = True
+        self,
+        llm_batch_id_agent_id_pairs: List[Tuple[str, str]],
+        field_updates: List[Dict[str, Any]],
+        strict: bool = True,
+        session: Optional[AsyncSession] = None,
     ) -> None:
         """
         Efficiently update multiple LLMBatchItem rows by (llm_batch_id, agent_id) pairs.
@@ -382,6 +485,9 @@ class LLMBatchManager:
             field_updates: List of dictionaries containing the fields to update for each item
             strict: Whether to error if any of the requested keys don't exist (default True).
                     If False, missing pairs are skipped.
+            session: Optional externally-managed session. When provided, the updates join the
+                     caller's transaction and the caller is responsible for committing; this
+                     lets several bulk updates share one session and commit instead of one each.
         """
         if not llm_batch_id_agent_id_pairs or not field_updates:
             return
@@ -389,43 +495,112 @@ class LLMBatchManager:
         if len(llm_batch_id_agent_id_pairs) != len(field_updates):
             raise ValueError("llm_batch_id_agent_id_pairs and field_updates must have the same length")
 
+        if session is not None:
+            await self._bulk_update_llm_batch_items(session, llm_batch_id_agent_id_pairs, field_updates, strict)
+            return
+
         async with db_registry.async_session() as session:
-            # Lookup primary keys for all requested (batch_id, agent_id) pairs
-            query = select(LLMBatchItem.id, LLMBatchItem.llm_batch_id, LLMBatchItem.agent_id).filter(
-                tuple_(LLMBatchItem.llm_batch_id, LLMBatchItem.agent_id).in_(llm_batch_id_agent_id_pairs)
-            )
-            result = await session.execute(query)
-            items = result.all()
-            pair_to_pk = {(batch_id, agent_id): pk for pk, batch_id, agent_id in items}
-
-            if strict:
-                requested = set(llm_batch_id_agent_id_pairs)
-                found = set(pair_to_pk.keys())
-                missing = requested - found
-                if missing:
-                    raise ValueError(
-                        f"Cannot bulk-update batch items: no records for the following (llm_batch_id, agent_id) pairs: {missing}"
-                    )
+            await self._bulk_update_llm_batch_items(session, llm_batch_id_agent_id_pairs, field_updates, strict)
+            await session.commit()
 
-            # Build mappings, skipping any missing when strict=False
-            mappings = []
-            for (batch_id, agent_id), fields in zip(llm_batch_id_agent_id_pairs, field_updates):
-                pk = pair_to_pk.get((batch_id, agent_id))
-                if pk is None:
-                    # skip missing in non-strict mode
-                    continue
+    async def _bulk_update_llm_batch_items(
+        self,
+        session: AsyncSession,
+        llm_batch_id_agent_id_pairs: List[Tuple[str, str]],
+        field_updates: List[Dict[str, Any]],
+        strict: bool,
+    ) -> None:
+        """Run the bulk item updates on the given session without committing."""
+        if strict:
+            # Only needed to surface missing pairs; the update itself keys
+            # directly on the composite (llm_batch_id, agent_id).
+            # Chunk the tuple IN clause: each pair contributes two bind
+            # parameters, and Postgres caps statements at ~65535 parameters
+            # while planning cost grows with the clause length.
+            found = set()
+            for chunk_start in range(0, len(llm_batch_id_agent_id_pairs), PAIR_QUERY_CHUNK_SIZE):
+                chunk = llm_batch_id_agent_id_pairs[chunk_start : chunk_start + PAIR_QUERY_CHUNK_SIZE]
+                query = select(LLMBatchItem.llm_batch_id, LLMBatchItem.agent_id).filter(
+                    tuple_(LLMBatchItem.llm_batch_id, LLMBatchItem.agent_id).in_(chunk)
+                )
+                result = await session.execute(query)
+                found.update((batch_id, agent_id) for batch_id, agent_id in result.all())
+            missing = set(llm_batch_id_agent_id_pairs) - found
+            if missing:
+                raise ValueError(f"Cannot bulk-update batch items: no records for the following (llm_batch_id, agent_id) pairs: {missing}")
+
+        # Group updates by field keyset so each group runs as a single
+        # executemany UPDATE keyed on (llm_batch_id, agent_id), with no
+        # per-pair primary-key lookup round-trip
+        update_groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for (batch_id, agent_id), fields in zip(llm_batch_id_agent_id_pairs, field_updates):
+            params = fields.copy()
+            params["_pair_llm_batch_id"] = batch_id
+            params["_pair_agent_id"] = agent_id
+            update_groups.setdefault(frozenset(fields), []).append(params)
+
+        for field_keys, params in update_groups.items():
+            if settings.database_engine is DatabaseChoice.POSTGRES:
+                # Each group is homogeneous by construction, so it can run as one
+                # UPDATE ... FROM (VALUES ...) joined on the composite key instead
+                # of an executemany round of per-row statements
+                await self._update_llm_batch_items_from_values(session, field_keys, params)
+            else:
+                # Build the statement against the Core table: an ORM update() executed
+                # with a parameter list takes SQLAlchemy's bulk-update-by-primary-key
+                # path, which errors out because these params carry no `id`
+                table = LLMBatchItem.__table__
+                stmt = (
+                    update(table)
+                    .where(
+                        table.c.llm_batch_id == bindparam("_pair_llm_batch_id"),
+                        table.c.agent_id == bindparam("_pair_agent_id"),
+                    )
+                    .values({key: bindparam(key) for key in field_keys})
+                )
+                await session.execute(stmt, params)
 
-                update_fields = fields.copy()
-                update_fields["id"] = pk
-                mappings.append(update_fields)
+    async def _update_llm_batch_items_from_values(
+        self,
+        session: AsyncSession,
+        field_keys: frozenset,
+        params: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Apply one group of same-keyset item updates as a single UPDATE joined
+        against an inline VALUES list on (llm_batch_id, agent_id).
 
-            if mappings:
-                await session.run_sync(lambda ses: ses.bulk_update_mappings(LLMBatchItem, mappings))
-                await session.commit()
+        Postgres-only; SQLite's UPDATE ... FROM support predates the versions we
+        still run against, so the executemany path stays as the fallback. Rows are
+        chunked so the inline bind count stays well under the ~65535 parameter cap.
+        """
+        table = LLMBatchItem.__table__
+        ordered_keys = sorted(field_keys)
+
+        for chunk_start in range(0, len(params), PAIR_QUERY_CHUNK_SIZE):
+            chunk = params[chunk_start : chunk_start + PAIR_QUERY_CHUNK_SIZE]
+            vals = Values(
+                column("llm_batch_id", table.c.llm_batch_id.type),
+                column("agent_id", table.c.agent_id.type),
+                *(column(key, table.c[key].type) for key in ordered_keys),
+                name="batch_item_updates",
+            ).data([tuple([row["_pair_llm_batch_id"], row["_pair_agent_id"]] + [row[key] for key in ordered_keys]) for row in chunk])
+            stmt = (
+                update(LLMBatchItem)
+                .where(
+                    LLMBatchItem.llm_batch_id == vals.c.llm_batch_id,
+                    LLMBatchItem.agent_id == vals.c.agent_id,
+                )
+                .values({key: vals.c[key] for key in ordered_keys})
+                .execution_options(synchronize_session=False)
+            )
+            await session.execute(stmt)
 
     @enforce_types
     @trace_method
-    async def bulk_update_batch_llm_items_results_by_agent_async(self, updates: List[ItemUpdateInfo], strict: bool = True) -> None:
+    async def bulk_update_batch_llm_items_results_by_agent_async(
+        self, updates: List[ItemUpdateInfo], strict: bool = True, session: Optional[AsyncSession] = None
+    ) -> None:
         """Update request status and batch results for multiple batch items."""
         batch_id_agent_id_pairs = [(update.llm_batch_id, update.agent_id) for update in updates]
         field_updates = [
@@ -436,29 +611,29 @@ class LLMBatchManager:
             for update in updates
         ]
 
-        await self.bulk_update_llm_batch_items_async(batch_id_agent_id_pairs, field_updates, strict=strict)
+        await self.bulk_update_llm_batch_items_async(batch_id_agent_id_pairs, field_updates, strict=strict, session=session)
 
     @enforce_types
     @trace_method
     async def bulk_update_llm_batch_items_step_status_by_agent_async(
-        self, updates: List[StepStatusUpdateInfo], strict: bool = True
+        self, updates: List[StepStatusUpdateInfo], strict: bool = True, session: Optional[AsyncSession] = None
     ) -> None:
         """Update step status for multiple batch items."""
         batch_id_agent_id_pairs = [(update.llm_batch_id, update.agent_id) for update in updates]
         field_updates = [{"step_status": update.step_status} for update in updates]
 
-        await self.bulk_update_llm_batch_items_async(batch_id_agent_id_pairs, field_updates, strict=strict)
+        await self.bulk_update_llm_batch_items_async(batch_id_agent_id_pairs, field_updates, strict=strict, session=session)
 
     @enforce_types
     @trace_method
     async def bulk_update_llm_batch_items_request_status_by_agent_async(
-        self, updates: List[RequestStatusUpdateInfo], strict: bool = True
+        self, updates: List[RequestStatusUpdateInfo], strict: bool = True, session: Optional[AsyncSession] = None
     ) -> None:
         """Update request status for multiple batch items."""
         batch_id_agent_id_pairs = [(update.llm_batch_id, update.agent_id) for update in updates]
         field_updates = [{"request_status": update.request_status} for update in updates]
 
-        await self.bulk_update_llm_batch_items_async(batch_id_agent_id_pairs, field_updates, strict=strict)
+        await self.bulk_update_llm_batch_items_async(batch_id_agent_id_pairs, field_updates, strict=strict, session=session)
 
     @enforce_types
     @trace_method
@@ -532,6 +532,62 @@ def test_agent_serialize_with_user_messages(server, serialize_test_agent, defaul
     )
 
 
+def test_message_to_dict_matches_marshmallow_dump(server, serialize_test_agent, default_user):
+    """The hand-rolled message serializer must stay in lockstep with the marshmallow schema."""
+    from letta.orm.message import Message as MessageModel
+    from letta.serialize_schemas.fast_message import message_to_dict
+    from letta.serialize_schemas.marshmallow_message import SerializedMessageSchema
+    from letta.server.db import db_registry
+
+    with db_registry.session() as session:
+        messages = session.query(MessageModel).filter(MessageModel.agent_id == serialize_test_agent.id).all()
+        assert messages, "Expected the test agent to have messages"
+
+        schema = SerializedMessageSchema(session=session, actor=default_user)
+        for message in messages:
+            expected = schema.dump(message)
+            # the agent dump drops per-message ids before writing them out
+            expected.pop("id")
+            assert message_to_dict(message) == expected
+
+
+def test_compiled_serialize_matches_marshmallow(server, serialize_test_agent, default_user):
+    """The generated dump path must produce exactly what marshmallow's generic loop does."""
+    from marshmallow import Schema
+
+    from letta.orm.message import Message as MessageModel
+    from letta.serialize_schemas.marshmallow_message import SerializedMessageSchema
+    from letta.server.db import db_registry
+
+    with db_registry.session() as session:
+        message = session.query(MessageModel).filter(MessageModel.agent_id == serialize_test_agent.id).first()
+        assert message is not None
+
+        schema = SerializedMessageSchema(session=session, actor=default_user)
+        assert schema._serialize(message, many=False) == Schema._serialize(schema, message, many=False)
+
+
+def test_preload_messages_matches_per_agent_queries(server, serialize_test_agent, default_user):
+    """Preloaded message buckets must match what the per-agent query path returns."""
+    from letta.serialize_schemas.marshmallow_agent import MarshmallowAgentSchema
+    from letta.server.db import db_registry
+
+    with db_registry.session() as session:
+        schema = MarshmallowAgentSchema(session=session, actor=default_user)
+        direct = schema._fetch_messages(serialize_test_agent.id)
+        assert direct, "Expected the test agent to have messages"
+
+        preloaded = MarshmallowAgentSchema.preload_messages(session, [serialize_test_agent.id], default_user.organization_id)
+        assert [m.id for m in preloaded[serialize_test_agent.id]] == [m.id for m in direct]
+
+        # With the bucket stashed in the context, _fetch_messages reads from it
+        schema.context[MarshmallowAgentSchema.CONTEXT_MESSAGES_BY_AGENT] = preloaded
+        assert [m.id for m in schema._fetch_messages(serialize_test_agent.id)] == [m.id for m in direct]
+
+        # Unknown agents fall back to an empty message list
+        assert schema._fetch_messages("agent-00000000-0000-0000-0000-000000000000") == []
+
+
 def test_agent_serialize_tool_calls(disable_e2b_api_key, server, serialize_test_agent, default_user, other_user):
     """Test deserializing JSON into an Agent instance."""
     append_copy_suffix = False
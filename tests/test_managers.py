@@ -10596,6 +10596,224 @@ async def test_count_batch_items(
     assert count == num_items, f"Expected {num_items} items, got {count}"
 
 
+async def test_bulk_update_batch_items_mixed_field_keysets(
+    server,
+    default_user,
+    sarah_agent,
+    charles_agent,
+    dummy_beta_message_batch,
+    dummy_llm_config,
+    dummy_step_state,
+    dummy_successful_response,
+    letta_batch_job,
+):
+    batch = await server.batch_manager.create_llm_batch_job_async(
+        llm_provider=ProviderType.anthropic,
+        create_batch_response=dummy_beta_message_batch,
+        actor=default_user,
+        letta_batch_job_id=letta_batch_job.id,
+    )
+    item_a = await server.batch_manager.create_llm_batch_item_async(
+        llm_batch_id=batch.id,
+        agent_id=sarah_agent.id,
+        llm_config=dummy_llm_config,
+        step_state=dummy_step_state,
+        actor=default_user,
+    )
+    item_b = await server.batch_manager.create_llm_batch_item_async(
+        llm_batch_id=batch.id,
+        agent_id=charles_agent.id,
+        llm_config=dummy_llm_config,
+        step_state=dummy_step_state,
+        actor=default_user,
+    )
+
+    # Different keysets per pair, so the update is split into one statement per group
+    await server.batch_manager.bulk_update_llm_batch_items_async(
+        [(batch.id, sarah_agent.id), (batch.id, charles_agent.id)],
+        [
+            {"request_status": JobStatus.completed, "batch_request_result": dummy_successful_response},
+            {"step_status": AgentStepStatus.resumed},
+        ],
+    )
+
+    updated_a = await server.batch_manager.get_llm_batch_item_by_id_async(item_a.id, actor=default_user)
+    assert updated_a.request_status == JobStatus.completed
+    assert updated_a.batch_request_result == dummy_successful_response
+    assert updated_a.step_status == AgentStepStatus.paused
+
+    updated_b = await server.batch_manager.get_llm_batch_item_by_id_async(item_b.id, actor=default_user)
+    assert updated_b.step_status == AgentStepStatus.resumed
+    assert updated_b.request_status == JobStatus.created
+
+
+async def test_bulk_update_batch_items_executemany_fallback(
+    monkeypatch,
+    server,
+    default_user,
+    sarah_agent,
+    charles_agent,
+    dummy_beta_message_batch,
+    dummy_llm_config,
+    dummy_step_state,
+    letta_batch_job,
+):
+    from letta.settings import DatabaseChoice
+
+    # Pin the non-Postgres branch (a plain Core executemany, valid on both engines)
+    monkeypatch.setattr(type(settings), "database_engine", property(lambda self: DatabaseChoice.SQLITE))
+
+    batch = await server.batch_manager.create_llm_batch_job_async(
+        llm_provider=ProviderType.anthropic,
+        create_batch_response=dummy_beta_message_batch,
+        actor=default_user,
+        letta_batch_job_id=letta_batch_job.id,
+    )
+    items = []
+    for agent_id in [sarah_agent.id, charles_agent.id]:
+        item = await server.batch_manager.create_llm_batch_item_async(
+            llm_batch_id=batch.id,
+            agent_id=agent_id,
+            llm_config=dummy_llm_config,
+            step_state=dummy_step_state,
+            actor=default_user,
+        )
+        items.append(item)
+
+    await server.batch_manager.bulk_update_llm_batch_items_async(
+        [(batch.id, sarah_agent.id), (batch.id, charles_agent.id)],
+        [{"request_status": JobStatus.completed}, {"request_status": JobStatus.expired}],
+    )
+
+    updated_a = await server.batch_manager.get_llm_batch_item_by_id_async(items[0].id, actor=default_user)
+    updated_b = await server.batch_manager.get_llm_batch_item_by_id_async(items[1].id, actor=default_user)
+    assert updated_a.request_status == JobStatus.completed
+    assert updated_b.request_status == JobStatus.expired
+
+
+async def test_bulk_update_batch_items_shared_session(
+    server,
+    default_user,
+    sarah_agent,
+    dummy_beta_message_batch,
+    dummy_llm_config,
+    dummy_step_state,
+    letta_batch_job,
+):
+    batch = await server.batch_manager.create_llm_batch_job_async(
+        llm_provider=ProviderType.anthropic,
+        create_batch_response=dummy_beta_message_batch,
+        actor=default_user,
+        letta_batch_job_id=letta_batch_job.id,
+    )
+    item = await server.batch_manager.create_llm_batch_item_async(
+        llm_batch_id=batch.id,
+        agent_id=sarah_agent.id,
+        llm_config=dummy_llm_config,
+        step_state=dummy_step_state,
+        actor=default_user,
+    )
+
+    # Both updates join the caller's session and are committed together by the caller
+    async with db_registry.async_session() as session:
+        await server.batch_manager.bulk_update_llm_batch_items_step_status_by_agent_async(
+            [StepStatusUpdateInfo(batch.id, sarah_agent.id, AgentStepStatus.resumed)], session=session
+        )
+        await server.batch_manager.bulk_update_llm_batch_items_request_status_by_agent_async(
+            [RequestStatusUpdateInfo(batch.id, sarah_agent.id, JobStatus.completed)], session=session
+        )
+        await session.commit()
+
+    updated = await server.batch_manager.get_llm_batch_item_by_id_async(item.id, actor=default_user)
+    assert updated.step_status == AgentStepStatus.resumed
+    assert updated.request_status == JobStatus.completed
+
+
+async def test_iter_batch_items_matches_list(
+    server, default_user, sarah_agent, dummy_beta_message_batch, dummy_llm_config, dummy_step_state, letta_batch_job
+):
+    batch = await server.batch_manager.create_llm_batch_job_async(
+        llm_provider=ProviderType.anthropic,
+        create_batch_response=dummy_beta_message_batch,
+        actor=default_user,
+        letta_batch_job_id=letta_batch_job.id,
+    )
+
+    for _ in range(5):
+        await server.batch_manager.create_llm_batch_item_async(
+            llm_batch_id=batch.id,
+            agent_id=sarah_agent.id,
+            llm_config=dummy_llm_config,
+            step_state=dummy_step_state,
+            actor=default_user,
+        )
+
+    listed = await server.batch_manager.list_llm_batch_items_async(llm_batch_id=batch.id, actor=default_user)
+    streamed = [item async for item in server.batch_manager.iter_llm_batch_items_async(llm_batch_id=batch.id, actor=default_user)]
+    assert [item.id for item in streamed] == [item.id for item in listed]
+
+    # Streaming respects the limit as well
+    limited = [item async for item in server.batch_manager.iter_llm_batch_items_async(llm_batch_id=batch.id, actor=default_user, limit=2)]
+    assert len(limited) == 2
+
+
+async def test_get_batch_job_and_items_to_pydantic_false(
+    server, default_user, sarah_agent, dummy_beta_message_batch, dummy_llm_config, dummy_step_state, letta_batch_job
+):
+    from letta.orm.llm_batch_items import LLMBatchItem as ORMLLMBatchItem
+    from letta.orm.llm_batch_job import LLMBatchJob as ORMLLMBatchJob
+
+    batch = await server.batch_manager.create_llm_batch_job_async(
+        llm_provider=ProviderType.anthropic,
+        create_batch_response=dummy_beta_message_batch,
+        actor=default_user,
+        letta_batch_job_id=letta_batch_job.id,
+    )
+    item = await server.batch_manager.create_llm_batch_item_async(
+        llm_batch_id=batch.id,
+        agent_id=sarah_agent.id,
+        llm_config=dummy_llm_config,
+        step_state=dummy_step_state,
+        actor=default_user,
+    )
+
+    orm_batch = await server.batch_manager.get_llm_batch_job_by_id_async(batch.id, actor=default_user, to_pydantic=False)
+    assert isinstance(orm_batch, ORMLLMBatchJob)
+    assert orm_batch.id == batch.id
+
+    orm_items = await server.batch_manager.list_llm_batch_items_async(llm_batch_id=batch.id, actor=default_user, to_pydantic=False)
+    assert all(isinstance(orm_item, ORMLLMBatchItem) for orm_item in orm_items)
+    assert item.id in [orm_item.id for orm_item in orm_items]
+
+
+async def test_create_batch_items_bulk_preserves_input_order(
+    server, default_user, sarah_agent, dummy_beta_message_batch, dummy_llm_config, dummy_step_state, letta_batch_job
+):
+    llm_batch_job = await server.batch_manager.create_llm_batch_job_async(
+        llm_provider=ProviderType.anthropic,
+        create_batch_response=dummy_beta_message_batch,
+        actor=default_user,
+        letta_batch_job_id=letta_batch_job.id,
+    )
+
+    batch_items = [
+        LLMBatchItem(
+            llm_batch_id=llm_batch_job.id,
+            agent_id=sarah_agent.id,
+            llm_config=dummy_llm_config,
+            request_status=JobStatus.created,
+            step_status=AgentStepStatus.paused,
+            step_state=dummy_step_state,
+        )
+        for _ in range(5)
+    ]
+
+    created_items = await server.batch_manager.create_llm_batch_items_bulk_async(batch_items, actor=default_user)
+
+    # The returned list lines up with the input list, not with database row order
+    assert [created.id for created in created_items] == [item.id for item in batch_items]
+
+
 # ======================================================================================================================
 # MCPManager Tests
 # ======================================================================================================================